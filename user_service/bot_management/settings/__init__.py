@@ -1,5 +1,6 @@
 from .base import *
 from .database import *
+from .cache import *
 from .logging import *
 from .static import *
 from .urls import *
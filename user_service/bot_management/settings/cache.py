@@ -0,0 +1,21 @@
+import os
+
+
+# gunicorn runs several worker processes, so the cache has to be shared
+# for an entry dropped after a write to be gone in every worker. Without a
+# Redis URL (e.g. a single local runserver process) keep it in memory.
+REDIS_URL = os.getenv("USER_SERVICE_REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
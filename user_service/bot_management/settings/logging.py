@@ -1,12 +1,23 @@
 import logging.config
+import os
 from pathlib import Path
 
+from .base import DEBUG
+
 
 LOG_DIR = (
     Path(__file__).resolve().parent.parent.parent / "logs" / "user-service"
 )
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+# DEBUG records (e.g. urllib3 logs every Bot-Service request) are only
+# formatted and written in development unless asked for explicitly.
+LOG_LEVEL = os.getenv("USER_SERVICE_LOG_LEVEL", "DEBUG" if DEBUG else "INFO")
+
+# Outside development a failing log handler must not print tracebacks to
+# stderr on every record.
+logging.raiseExceptions = DEBUG
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -33,7 +44,7 @@ LOGGING = {
     "loggers": {
         "": {  # корень логгера
             "handlers": ["console", "file"],
-            "level": "DEBUG",
+            "level": LOG_LEVEL,
         },
     },
 }
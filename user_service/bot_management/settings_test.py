@@ -3,6 +3,8 @@ import logging.config
 from bot_management.settings.apps import *
 from bot_management.settings.auth import *
 from bot_management.settings.base import *
+from bot_management.settings.base import BASE_DIR
+from bot_management.settings.cache import *
 from bot_management.settings.database import *
 from bot_management.settings.internationalization import *
 from bot_management.settings.logging import *
@@ -17,13 +19,23 @@ LOGGING = {
 
 logging.config.dictConfig(LOGGING)
 
-for logger in logging.Logger.manager.loggerDict.values():
-    if isinstance(logger, logging.Logger):
-        logger.disabled = True
-
-logging.getLogger().disabled = True
+# Loggers such as "bots" are created after this module runs and propagate
+# to the root handlers, so disabling existing loggers is not enough to keep
+# the JSON formatter and log file out of the error paths under test.
+logging.disable(logging.CRITICAL)
 
 DATABASES["default"] = {  # type:ignore
     "ENGINE": "django.db.backends.sqlite3",
     "NAME": ":memory:",
+    # An on-disk test database lets pytest --reuse-db skip creating the
+    # schema and running migrations every time.
+    "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},  # type:ignore
+}
+
+# Tests must not need a Redis server; each test that uses the cache clears
+# it first.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
 }
@@ -10,8 +10,15 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bot_management.settings")
 
 application = get_wsgi_application()
+
+# Build the URL resolver and compile its patterns when a server loads the
+# app instead of on the first request. Done here rather than in an
+# AppConfig so management commands (migrate, collectstatic) skip it.
+# _populate() is private Django API; if it goes away, drop this warm-up.
+get_resolver()._populate()
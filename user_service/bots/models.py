@@ -1,7 +1,15 @@
+from typing import cast
+
 from django.contrib.auth.models import User
 from django.db import models
 
 
+class BotQuerySet(models.QuerySet):
+    def owned_by(self, user: User) -> "BotQuerySet":
+        """Limit the queryset to bots that belong to the given user."""
+        return cast("BotQuerySet", self.filter(user_id=user.id))
+
+
 class Bot(models.Model):
     bot_username = models.CharField(max_length=255)
     user = models.ForeignKey(
@@ -10,5 +18,7 @@ class Bot(models.Model):
     bot_id = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = BotQuerySet.as_manager()
+
     def __str__(self):
         return self.bot_username
@@ -25,7 +25,8 @@ class BotService:
             return cast(Dict[str, Any], response.json())
         except RequestException as e:
             logger.error(
-                f"Failed to fetch bot details. Bot ID: {bot_id}. Error: {str(e)}",
+                "Failed to fetch bot details. Bot ID: %s",
+                bot_id,
                 exc_info=True,
             )
             raise ValidationError(f"Не удалось получить данные бота: {str(e)}")
@@ -52,7 +53,8 @@ class BotService:
             return cast(Dict[str, Any], response.json())
         except RequestException as e:
             logger.error(
-                f"Failed to update bot. Bot ID: {bot_id}. Error: {str(e)}",
+                "Failed to update bot. Bot ID: %s",
+                bot_id,
                 exc_info=True,
             )
             raise ValidationError(f"Не удалось обновить бота: {str(e)}")
@@ -68,7 +70,8 @@ class BotService:
             return cast(Dict[str, Any], response.json())
         except RequestException as e:
             logger.error(
-                f"Failed to create bot. Token: {token}. Error: {str(e)}",
+                "Failed to create bot. Token: %s",
+                token,
                 exc_info=True,
             )
             raise ValidationError(f"Не удалось создать бота: {str(e)}")
@@ -81,7 +84,8 @@ class BotService:
             response.raise_for_status()
         except RequestException as e:
             logger.error(
-                f"Failed to delete bot. Bot ID: {bot_id}. Error: {str(e)}",
+                "Failed to delete bot. Bot ID: %s",
+                bot_id,
                 exc_info=True,
             )
             raise ValidationError(f"Не удалось удалить бота: {str(e)}")
@@ -104,12 +108,12 @@ class BotUserService:
 
             if not isinstance(data, dict) or "users" not in data:
                 logger.error(
-                    f"Unexpected API response format: {data}", exc_info=True
+                    "Unexpected API response format: %s", data, exc_info=True
                 )
                 return []
 
             users = data.get("users", [])
             return cast(List[Dict[str, Any]], users)
-        except (RequestException, json.JSONDecodeError) as e:
-            logger.error(f"Failed to get bot users: {str(e)}", exc_info=True)
+        except (RequestException, json.JSONDecodeError):
+            logger.error("Failed to get bot users", exc_info=True)
             return []
@@ -0,0 +1,25 @@
+import factory
+from bots.models import Bot
+from django.contrib.auth.models import User
+from factory.django import DjangoModelFactory
+
+
+class UserFactory(DjangoModelFactory):
+    """Factory for users that never log in through the auth backend."""
+
+    class Meta:
+        model = User
+        django_get_or_create = ("username",)
+
+    username = "testuser"
+    password = factory.django.Password(None)
+
+
+class BotFactory(DjangoModelFactory):
+    """Factory for a bot owned by a user built with UserFactory."""
+
+    class Meta:
+        model = Bot
+
+    user = factory.SubFactory(UserFactory)
+    bot_id = 123
@@ -54,3 +54,18 @@ class BotModelTest(TestCase):
 
         # Assert that the string representation returns the bot's username
         self.assertEqual(str(bot), "test_bot")
+
+    def test_owned_by(self):
+        """Test that owned_by returns only the given user's bots."""
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass"
+        )
+        own_bot = Bot.objects.create(
+            bot_username="own_bot", user=self.user, bot_id=1
+        )
+        Bot.objects.create(bot_username="other_bot", user=other_user, bot_id=2)
+
+        # Only the bot of self.user should be returned
+        self.assertQuerySetEqual(
+            Bot.objects.owned_by(self.user), [own_bot], ordered=False
+        )
@@ -14,7 +14,7 @@ class TestUrls(SimpleTestCase):
     def test_bots_list_url_resolves(self):
         """Test that the URL for listing bots resolves to the BotsView."""
         url = reverse("bots")  # Generate the URL for the 'bots' view
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotsView
         )  # Check that it resolves to the correct view
         self.assertEqual(
@@ -24,7 +24,7 @@ class TestUrls(SimpleTestCase):
     def test_add_bot_url_resolves(self):
         """Test that the URL for adding a bot resolves to the AddBotView."""
         url = reverse("add-bot")  # Generate the URL for the 'add-bot' view
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, AddBotView
         )  # Verify the correct view is resolved
         self.assertEqual(
@@ -34,7 +34,7 @@ class TestUrls(SimpleTestCase):
     def test_bot_details_url_resolves(self):
         """Test that the URL for bot details resolves to the BotDetailView."""
         url = reverse("bot-detail", args=[1])  # Generate URL for bot with ID 1
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotDetailView
         )  # Check resolution to the correct view
         self.assertEqual(url, "/bots/1/")  # Validate expected URL
@@ -44,7 +44,7 @@ class TestUrls(SimpleTestCase):
         url = reverse(
             "bot-delete", args=[1]
         )  # Generate URL to delete bot with ID 1
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotDeleteView
         )  # Verify view resolution
         self.assertEqual(
@@ -56,7 +56,7 @@ class TestUrls(SimpleTestCase):
         url = reverse(
             "bot-default-reply", args=[1]
         )  # Generate URL for default reply of bot with ID 1
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotDefaultReplyView
         )  # Check correct view resolution
         self.assertEqual(url, "/bots/1/default-reply/")  # Assert expected URL
@@ -66,7 +66,7 @@ class TestUrls(SimpleTestCase):
         url = reverse(
             "bot-users", args=[1]
         )  # Generate URL for users of bot with ID 1
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotUsersView
         )  # Verify resolution to the correct view
         self.assertEqual(url, "/bots/1/users/")  # Check expected URL
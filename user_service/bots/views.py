@@ -5,7 +5,6 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.paginator import EmptyPage, Paginator
 from django.http import (
-    Http404,
     HttpResponse,
     HttpResponseRedirect,
 )
@@ -26,9 +25,9 @@ class BaseBotView(LoginRequiredMixin, View):
 
     def get_bot_or_404(self, bot_id: int) -> Bot:
         """Retrieve bot or raise 404, checking ownership."""
-        bot: Bot = get_object_or_404(Bot, id=bot_id)
-        if bot.user != self.request.user:
-            raise Http404("Вы не являетесь владельцем данного бота.")
+        bot: Bot = get_object_or_404(
+            Bot.objects.owned_by(self.request.user), id=bot_id
+        )
         return bot
 
 
@@ -39,7 +38,7 @@ class BotsView(LoginRequiredMixin, View):
 
     def get(self, request) -> HttpResponse:
         """Handle GET requests to display user's bots."""
-        bots = Bot.objects.filter(user=request.user)
+        bots = Bot.objects.owned_by(request.user)
         return render(request, self.template_name, {"bots": bots})
 
 
@@ -54,9 +53,10 @@ class BotDetailView(BaseBotView):
 
         try:
             bot_data = BotService.get_bot_details(bot.bot_id)
-        except Exception as e:
+        except Exception:
             logger.error(
-                f"Failed to fetch bot details. Bot ID: {bot.bot_id}. Error: {str(e)}",
+                "Failed to fetch bot details. Bot ID: %s",
+                bot.bot_id,
                 exc_info=True,
             )
             bot_data = {"username": bot.bot_username, "token_error": True}
@@ -85,9 +85,10 @@ class BotDetailView(BaseBotView):
             bot.bot_username = updated_bot["username"]
             bot.save()
             messages.success(request, "Данные бота успешно обновлены.")
-        except Exception as e:
+        except Exception:
             logger.error(
-                f"Failed to update bot. Bot ID: {bot.bot_id}. Error: {str(e)}",
+                "Failed to update bot. Bot ID: %s",
+                bot.bot_id,
                 exc_info=True,
             )
             messages.error(
@@ -111,9 +112,10 @@ class BotDeleteView(BaseBotView):
             bot.delete()
             messages.success(request, f"Бот @{bot_username} успешно удален.")
             return redirect("bots")
-        except Exception as e:
+        except Exception:
             logger.error(
-                f"Failed to delete bot. Bot ID: {bot.bot_id}. Error: {str(e)}",
+                "Failed to delete bot. Bot ID: %s",
+                bot.bot_id,
                 exc_info=True,
             )
             messages.error(request, "Ошибка при удалении бота.")
@@ -136,9 +138,9 @@ class AddBotView(LoginRequiredMixin, FormView):
                 bot_username=bot_data["username"],
             )
             return redirect("bot-detail", bot_id=bot.id)
-        except Exception as e:
+        except Exception:
             logger.error(
-                f"Failed to create bot. Error: {str(e)}",
+                "Failed to create bot",
                 exc_info=True,
             )
             return self.form_invalid(
@@ -165,9 +167,10 @@ class BotDefaultReplyView(BaseBotView):
 
         try:
             bot_data = BotService.get_bot_details(bot.bot_id)
-        except Exception as e:
+        except Exception:
             logger.error(
-                f"Failed to fetch bot's default reply. Bot ID: {bot.bot_id}. Error: {str(e)}",
+                "Failed to fetch bot's default reply. Bot ID: %s",
+                bot.bot_id,
                 exc_info=True,
             )
             bot_data = {}
@@ -194,9 +197,10 @@ class BotDefaultReplyView(BaseBotView):
                 default_reply=form.cleaned_data["default_reply"],
             )
             messages.success(request, "Успешно обновлено.")
-        except Exception as e:
+        except Exception:
             logger.error(
-                f"Failed to update bot. Bot ID: {bot.bot_id}. Error: {str(e)}",
+                "Failed to update bot. Bot ID: %s",
+                bot.bot_id,
                 exc_info=True,
             )
             messages.error(
@@ -2,6 +2,7 @@ import logging
 from typing import Any, Dict, List, Optional, Union, cast
 
 import requests
+from core import cache
 from django.conf import settings
 from requests.exceptions import RequestException
 
@@ -11,6 +12,11 @@ from .types import ChainButtonData, ChainData, ChainStepData
 logger = logging.getLogger("bots")
 
 
+def bot_chains_cache_key(bot_id: int) -> str:
+    """Return the cache key under which a bot's chains are stored."""
+    return f"bot_chains:{bot_id}"
+
+
 class BaseAPIService:
     BASE_URL = settings.BOT_SERVICE_API_URL
 
@@ -32,9 +38,10 @@ class BaseAPIService:
             if response.content:
                 return response.json()  # type: ignore
             return {}
-        except RequestException as e:
+        except RequestException:
             logger.error(
-                f"API request failed. Endpoint: {endpoint}. Error: {str(e)}",
+                "API request failed. Endpoint: %s",
+                endpoint,
                 exc_info=True,
             )
             raise
@@ -51,6 +58,11 @@ class ChainService(BaseAPIService):
         response = cls._make_request("GET", f"chains/{bot_id}")
         return cast(Dict[str, List[ChainData]], response)
 
+    @classmethod
+    def invalidate_bot_chains(cls, bot_id: int) -> None:
+        """Drop the cached chains after the bot's chains were changed."""
+        cache.delete(bot_chains_cache_key(bot_id))
+
     @classmethod
     def create_chain(cls, bot_id: int, name: str) -> ChainData:
         response = cls._make_request(
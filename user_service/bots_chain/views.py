@@ -20,11 +20,16 @@ logger = logging.getLogger("bots")
 
 class BaseChainView(LoginRequiredMixin, View):
     def get_bot_or_404(self, bot_id: int) -> Bot:
-        bot = get_object_or_404(Bot, id=bot_id)
-        if bot.user != self.request.user:
-            raise Http404("You are not the owner of this bot.")
+        bot: Bot = get_object_or_404(
+            Bot.objects.owned_by(self.request.user), id=bot_id
+        )
         return bot
 
+    def report_api_error(self, action: str, user_message: str) -> None:
+        """Log a failed Bot-Service call and show the user an error."""
+        logger.error("Failed to %s", action, exc_info=True)
+        messages.error(self.request, user_message)
+
 
 class BotChainDetailView(BaseChainView):
     template_name = "bots_chain/chain_details.html"
@@ -40,8 +45,8 @@ class BotChainDetailView(BaseChainView):
                 self.template_name,
                 {"bot": bot, "chain": chain_data, "chain_json": chain_json},
             )
-        except RequestException as e:
-            logger.error(f"Failed to fetch chain: {str(e)}", exc_info=True)
+        except RequestException:
+            logger.error("Failed to fetch chain", exc_info=True)
             empty_chain: ChainData = {"id": 0, "name": ""}
             return render(
                 request,
@@ -63,8 +68,8 @@ class BotChainView(BaseChainView):
                 self.template_name,
                 {"bot": bot, "chains": chains_response.get("chains", [])},
             )
-        except RequestException as e:
-            logger.error(f"Failed to fetch chains: {str(e)}", exc_info=True)
+        except RequestException:
+            logger.error("Failed to fetch chains", exc_info=True)
             return render(
                 request,
                 self.template_name,
@@ -85,8 +90,8 @@ class BotChainsResultView(BaseChainView):
                 self.template_name,
                 {"bot": bot, "chains": chains_response.get("chains", [])},
             )
-        except RequestException as e:
-            logger.error(f"Failed to fetch chains: {str(e)}", exc_info=True)
+        except RequestException:
+            logger.error("Failed to fetch chains", exc_info=True)
             return render(
                 request,
                 self.template_name,
@@ -113,12 +118,12 @@ class CreateChainView(BaseChainView):
 
         try:
             ChainService.create_chain(bot.bot_id, form.cleaned_data["name"])
+            ChainService.invalidate_bot_chains(bot.bot_id)
             messages.success(request, "Цепочка создана успешно.")
             return redirect("chain-list", bot_id=bot.id)
-        except RequestException as e:
-            logger.error(f"Failed to create chain: {str(e)}", exc_info=True)
-            messages.error(
-                request,
+        except RequestException:
+            self.report_api_error(
+                "create chain",
                 "Ошибка создания цепочки. Возможно цепочка с таким именем уже существует.",
             )
             return redirect("chain-list", bot_id=bot.id)
@@ -137,11 +142,11 @@ class UpdateChainView(BaseChainView):
 
         try:
             ChainService.update_chain(chain_id, form.cleaned_data["name"])
+            ChainService.invalidate_bot_chains(bot.bot_id)
             messages.success(request, "Цепочка успешно обновлена.")
             return redirect("chain-detail", bot_id=bot.id, chain_id=chain_id)
-        except RequestException as e:
-            logger.error(f"Failed to update chain: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка обновления цепочки.")
+        except RequestException:
+            self.report_api_error("update chain", "Ошибка обновления цепочки.")
             return redirect("chain-update", bot_id=bot.id, chain_id=chain_id)
 
 
@@ -149,14 +154,14 @@ class DeleteChainView(BaseChainView):
     def post(
         self, request, bot_id: int, chain_id: int
     ) -> HttpResponseRedirect:
-        self.get_bot_or_404(bot_id)
+        bot = self.get_bot_or_404(bot_id)
 
         try:
             ChainService.delete_chain(chain_id)
+            ChainService.invalidate_bot_chains(bot.bot_id)
             messages.success(request, "Цепочка успешно удалена.")
-        except RequestException as e:
-            logger.error(f"Failed to delete chain: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка удаления цепочки.")
+        except RequestException:
+            self.report_api_error("delete chain", "Ошибка удаления цепочки.")
 
         return redirect("chain-list", bot_id=bot_id)
 
@@ -165,10 +170,8 @@ class ChainStepMixin(BaseChainView):
     def get_step_data(self, step_id: int) -> ChainStepData:
         try:
             return ChainStepService.get_step(step_id)
-        except RequestException as e:
-            logger.error(
-                f"Failed to get step {step_id}: {str(e)}", exc_info=True
-            )
+        except RequestException:
+            logger.error("Failed to get step %s", step_id, exc_info=True)
             raise Http404("Step not found")
 
 
@@ -186,9 +189,8 @@ class CreateChainStepView(ChainStepMixin):
                 button_id=request.POST.get("set_as_next_step_for_button_id"),
             )
             messages.success(request, "Шаг успешно создан.")
-        except RequestException as e:
-            logger.error(f"Failed to create step: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка создания шага.")
+        except RequestException:
+            self.report_api_error("create step", "Ошибка создания шага.")
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
 
@@ -212,12 +214,10 @@ class CreateChainStepTextinputView(ChainStepMixin):
             messages.success(
                 request, "Шаг для текстового ввода успешно создан."
             )
-        except RequestException as e:
-            logger.error(
-                f"Failed to create textinput step: {str(e)}", exc_info=True
-            )
-            messages.error(
-                request, "Ошибка создания шага для текстового ввода."
+        except RequestException:
+            self.report_api_error(
+                "create textinput step",
+                "Ошибка создания шага для текстового ввода.",
             )
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
@@ -250,9 +250,8 @@ class UpdateChainStepView(ChainStepMixin):
                 message=request.POST.get("message"),
             )
             messages.success(request, "Шаг успешно обновлен.")
-        except RequestException as e:
-            logger.error(f"Failed to update step: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка обновления шага.")
+        except RequestException:
+            self.report_api_error("update step", "Ошибка обновления шага.")
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
 
@@ -266,9 +265,8 @@ class DeleteChainStepView(ChainStepMixin):
         try:
             ChainStepService.delete_step(step_id)
             messages.success(request, "Шаг успешно удален.")
-        except RequestException as e:
-            logger.error(f"Failed to delete step: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка удаления шага.")
+        except RequestException:
+            self.report_api_error("delete step", "Ошибка удаления шага.")
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
 
@@ -289,12 +287,10 @@ class EditTextinputView(ChainStepMixin):
                 messages.success(request, "Текстовый ввод включен.")
             else:
                 messages.success(request, "Текстовый ввод отключен.")
-        except RequestException as e:
-            logger.error(
-                f"Failed to update text input: {str(e)}", exc_info=True
-            )
-            messages.error(
-                request, "Ошибка обновления настроек текстового ввода."
+        except RequestException:
+            self.report_api_error(
+                "update text input",
+                "Ошибка обновления настроек текстового ввода.",
             )
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
@@ -304,10 +300,8 @@ class ChainButtonMixin(BaseChainView):
     def get_button_data(self, button_id: int) -> ChainButtonData:
         try:
             return ChainButtonService.get_button(button_id)
-        except RequestException as e:
-            logger.error(
-                f"Failed to get button {button_id}: {str(e)}", exc_info=True
-            )
+        except RequestException:
+            logger.error("Failed to get button %s", button_id, exc_info=True)
             raise Http404("Button not found")
 
 
@@ -322,9 +316,8 @@ class CreateChainButtonView(ChainButtonMixin):
                 step_id=int(request.POST.get("step_id")), text="<Не задано>"
             )
             messages.success(request, "Кнопка успешно создана.")
-        except RequestException as e:
-            logger.error(f"Failed to create button: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка создания кнопки.")
+        except RequestException:
+            self.report_api_error("create button", "Ошибка создания кнопки.")
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
 
@@ -354,9 +347,8 @@ class UpdateChainButtonView(ChainButtonMixin):
                 button_id=button_id, text=request.POST.get("text")
             )
             messages.success(request, "Кнопка успешно обновлена.")
-        except RequestException as e:
-            logger.error(f"Failed to update button: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка обновления кнопки.")
+        except RequestException:
+            self.report_api_error("update button", "Ошибка обновления кнопки.")
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
 
@@ -370,9 +362,8 @@ class DeleteChainButtonView(ChainButtonMixin):
         try:
             ChainButtonService.delete_button(button_id)
             messages.success(request, "Кнопка успешно удалена.")
-        except RequestException as e:
-            logger.error(f"Failed to delete button: {str(e)}", exc_info=True)
-            messages.error(request, "Ошибка удаления кнопки.")
+        except RequestException:
+            self.report_api_error("delete button", "Ошибка удаления кнопки.")
 
         return redirect("chain-detail", bot_id=bot_id, chain_id=chain_id)
 
@@ -47,7 +47,8 @@ class MailingService:
             return cls._validate_response(response, bot_id)
         except RequestException as e:
             logger.error(
-                f"Mailing API request failed for bot {bot_id}: {str(e)}",
+                "Mailing API request failed for bot %s",
+                bot_id,
                 exc_info=True,
             )
             raise RequestException(f"Mailing failed: {str(e)}") from e
@@ -75,7 +76,7 @@ class MailingService:
         if not isinstance(response_data, dict):
             error_msg = f"Invalid API response format for bot {bot_id}"
             logger.error(
-                f"{error_msg}. Response: {response.text}", exc_info=True
+                "%s. Response: %s", error_msg, response.text, exc_info=True
             )
             raise ValueError(error_msg)
 
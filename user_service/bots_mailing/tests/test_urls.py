@@ -9,7 +9,7 @@ class TestMailingUrl(SimpleTestCase):
         url = reverse(
             "mailing", args=[1]
         )  # Generate the URL for a bot with ID 1
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, MailingView
         )  # Check if it resolves to MailingView
 
@@ -3,7 +3,7 @@ import logging
 from bots.models import Bot
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 from requests.exceptions import RequestException
@@ -60,16 +60,15 @@ class MailingView(LoginRequiredMixin, View):
         try:
             MailingService.send_mailing(bot.bot_id, message_text)
             messages.success(request, "Рассылка запущена.")
-        except RequestException as e:
-            logger.error(
-                f"Mailing failed for bot {bot_id}: {str(e)}", exc_info=True
-            )
+        except RequestException:
+            logger.error("Mailing failed for bot %s", bot_id, exc_info=True)
             messages.error(
                 request, "Ошибка запуска рассылки. Попробуйте повторить позже."
             )
-        except Exception as e:
+        except Exception:
             logger.critical(
-                f"Unexpected error in mailing for bot {bot_id}: {str(e)}",
+                "Unexpected error in mailing for bot %s",
+                bot_id,
                 exc_info=True,
             )
             messages.error(
@@ -80,7 +79,7 @@ class MailingView(LoginRequiredMixin, View):
 
     def _get_authorized_bot(self, bot_id: int) -> Bot:
         """Get bot and verify user permission"""
-        bot = get_object_or_404(Bot, id=bot_id)
-        if bot.user != self.request.user:
-            raise Http404("Permission denied")
+        bot: Bot = get_object_or_404(
+            Bot.objects.owned_by(self.request.user), id=bot_id
+        )
         return bot
@@ -2,12 +2,50 @@ import logging
 from typing import Any, Dict, List, Union, cast
 
 import requests
+from bots_chain.services import bot_chains_cache_key
+from core import cache
 from django.conf import settings
-from requests.exceptions import RequestException
+from requests.adapters import HTTPAdapter
+from requests.exceptions import (
+    ConnectionError,
+    HTTPError,
+    RequestException,
+    Timeout,
+)
+from urllib3.util.retry import Retry
 
 
 logger = logging.getLogger("bots")
 
+# Failures that BotServiceClient re-raises to its callers.
+BOT_SERVICE_ERRORS = (ConnectionError, Timeout, HTTPError)
+
+# Chains change far less often than the menu pages that list them are
+# rendered, so keep them for a short time per bot. The bots_chain views
+# drop the cached copy after each change.
+CHAINS_CACHE_TIMEOUT = 30
+
+# The main menu only changes through the bots_menu views, which drop the
+# cached copy after each successful write.
+MAIN_MENU_CACHE_TIMEOUT = 60
+
+# (connect, read) timeout applied unless a call passes its own, so a slow
+# Bot-Service cannot stall the worker serving a page.
+BOT_SERVICE_TIMEOUT = (3, 10)
+
+# Shared session so requests to the Bot-Service reuse pooled keep-alive
+# connections instead of opening a new one per call. Only failures to
+# connect are retried: once a request has reached the Bot-Service, a read
+# error may mean it was already applied.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.1),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 class BotServiceClient:
     """Client for interacting with the Bot-Service API."""
@@ -23,13 +61,18 @@ class BotServiceClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             expect_json: Whether to expect JSON response
-            **kwargs: Additional arguments for requests.request
+            **kwargs: Additional arguments for requests.Session.request
 
         Returns:
             Parsed JSON response if expect_json=True, otherwise response text
+
+        Raises:
+            RequestException: The original requests error, so callers can
+                catch the specific BOT_SERVICE_ERRORS types
         """
+        kwargs.setdefault("timeout", BOT_SERVICE_TIMEOUT)
         try:
-            response = requests.request(
+            response = _session.request(
                 method, f"{settings.BOT_SERVICE_API_URL}{endpoint}", **kwargs
             )
             response.raise_for_status()
@@ -44,23 +87,39 @@ class BotServiceClient:
                 Union[Dict[str, Any], List[Dict[str, Any]]], response.json()
             )
 
-        except RequestException as e:
+        except RequestException:
             logger.error(
-                f"API request failed. Endpoint: {endpoint}. Error: {str(e)}",
+                "API request failed. Endpoint: %s",
+                endpoint,
                 exc_info=True,
             )
-            raise RequestException(f"API request failed: {str(e)}")
+            raise
 
     # Bot operations
 
     # Main Menu operations
+    @staticmethod
+    def _main_menu_cache_key(bot_id: int) -> str:
+        return f"bot_main_menu:{bot_id}"
+
     @staticmethod
     def get_main_menu(bot_id: int) -> Dict[str, Any]:
         return cast(
             Dict[str, Any],
-            BotServiceClient._handle_request("GET", f"menu/{bot_id}"),
+            cache.get_or_fetch(
+                BotServiceClient._main_menu_cache_key(bot_id),
+                lambda: BotServiceClient._handle_request(
+                    "GET", f"menu/{bot_id}"
+                ),
+                MAIN_MENU_CACHE_TIMEOUT,
+            ),
         )
 
+    @staticmethod
+    def invalidate_main_menu(bot_id: int) -> None:
+        """Drop the cached main menu after the menu or a button changed."""
+        cache.delete(BotServiceClient._main_menu_cache_key(bot_id))
+
     @staticmethod
     def update_main_menu(bot_id: int, welcome_message: str) -> Dict[str, Any]:
         return cast(
@@ -110,5 +169,19 @@ class BotServiceClient:
     def get_bot_chains(bot_id: int) -> Dict[str, Any]:
         return cast(
             Dict[str, Any],
-            BotServiceClient._handle_request("GET", f"chains/{bot_id}"),
+            cache.get_or_fetch(
+                bot_chains_cache_key(bot_id),
+                lambda: BotServiceClient._handle_request(
+                    "GET", f"chains/{bot_id}"
+                ),
+                CHAINS_CACHE_TIMEOUT,
+            ),
         )
+
+    @staticmethod
+    def get_bot_chains_safe(bot_id: int) -> Dict[str, Any]:
+        """Return the bot's chains, or no chains if the API call fails."""
+        try:
+            return BotServiceClient.get_bot_chains(bot_id)
+        except BOT_SERVICE_ERRORS:
+            return {"chains": {}}
@@ -0,0 +1,71 @@
+import pytest
+from bots.tests.factories import BotFactory
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test.signals import template_rendered
+from django.test.utils import ContextList
+
+from .. import views
+from ..services import BotServiceClient
+
+
+@pytest.fixture(scope="class")
+def owned_bot(request):
+    """Build an unsaved user and bot shared by every test in a class.
+
+    The views look the bot up with get_object_or_404, which is patched to
+    return the in-memory instance, so these tests never touch the database.
+    """
+    bot = BotFactory.build(id=1, user__id=1)
+    request.cls.user, request.cls.bot = bot.user, bot
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(views, "get_object_or_404", lambda *args, **kwargs: bot)
+        yield bot.user, bot
+
+
+@pytest.fixture
+def stub_bot_client(monkeypatch):
+    """Return a helper replacing a BotServiceClient method with a stub.
+
+    The stub returns ``result``, or raises it when it is an exception.
+    Plain functions are much cheaper to build than MagicMock instances.
+    """
+
+    def _stub(name, result=None):
+        def _method(*args, **kwargs):
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(BotServiceClient, name, staticmethod(_method))
+
+    return _stub
+
+
+@pytest.fixture
+def request_with_messages(rf):
+    """Return a helper building requests with message storage attached."""
+
+    def _make(method, path="/", data=None):
+        request = getattr(rf, method)(path, data or {})
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    return _make
+
+
+@pytest.fixture
+def template_context():
+    """Collect the context of every template rendered during the test.
+
+    RequestFactory responses have no ``context`` attribute, so this listens
+    to the same signal the test client uses to fill it in.
+    """
+    contexts = ContextList()
+
+    def _store(sender, context, **kwargs):
+        contexts.append(context)
+
+    template_rendered.connect(_store)
+    yield contexts
+    template_rendered.disconnect(_store)
@@ -0,0 +1,56 @@
+from bots.tests.factories import BotFactory, UserFactory
+from django.test import TestCase
+from django.urls import reverse
+
+
+class BotOwnerRequiredMixinTest(TestCase):
+    """Test that the menu views only serve bots owned by the user."""
+
+    URL_CASES: tuple[tuple[str, dict[str, int]], ...] = (
+        ("menu-main", {}),
+        ("menu-button-create", {}),
+        ("menu-button-detail", {"button_id": 1}),
+        ("menu-button-update", {"button_id": 1}),
+        ("menu-button-delete", {"button_id": 1}),
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a user and a bot that belongs to someone else."""
+        cls.user = UserFactory(username="owner")
+        cls.other_bot = BotFactory(user__username="other")
+
+    def urls(self):
+        """Yield the name and URL of every menu view for the other bot."""
+        for name, kwargs in self.URL_CASES:
+            yield name, reverse(
+                name, kwargs={"bot_id": self.other_bot.id, **kwargs}
+            )
+
+    def test_get_other_users_bot(self):
+        """Test that GET requests for another user's bot return 404."""
+        self.client.force_login(self.user)
+
+        for name, url in self.urls():
+            with self.subTest(name=name):
+                self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_post_other_users_bot(self):
+        """Test that POST requests for another user's bot return 404."""
+        self.client.force_login(self.user)
+
+        for name, url in self.urls():
+            with self.subTest(name=name):
+                self.assertEqual(self.client.post(url).status_code, 404)
+
+    def test_anonymous_redirects_to_login(self):
+        """Test that anonymous requests are redirected to the login page."""
+        for name, url in self.urls():
+            with self.subTest(name=name):
+                response = self.client.get(url)
+
+                self.assertRedirects(
+                    response,
+                    f"{reverse('login')}?next={url}",
+                    fetch_redirect_response=False,
+                )
@@ -0,0 +1,285 @@
+import socket
+
+import pytest
+from bots_chain.services import ChainService
+from core import cache as core_cache
+from django.contrib import messages
+from django.core.cache import cache
+from redis.exceptions import ConnectionError as RedisConnectionError
+from requests.exceptions import ConnectionError
+from urllib3.util import connection
+
+from .. import services
+from ..services import (
+    BOT_SERVICE_ERRORS,
+    BOT_SERVICE_TIMEOUT,
+    BotServiceClient,
+)
+from ..views import BotMainMenuView
+
+
+class BrokenCache:
+    """Cache backend stand-in failing like an unreachable Redis server."""
+
+    def _fail(self, *args, **kwargs):
+        raise RedisConnectionError("Connection refused")
+
+    get = set = delete = _fail
+
+
+class FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+
+    content = b'{"ok": true}'
+    text = '{"ok": true}'
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"ok": True}
+
+
+@pytest.fixture
+def session_calls(monkeypatch, settings):
+    """Record the calls BotServiceClient makes on the shared session."""
+    settings.BOT_SERVICE_API_URL = "http://bot-service/"
+    calls = []
+
+    def _request(method, url, **kwargs):
+        calls.append((method, url, kwargs))
+        return FakeResponse()
+
+    monkeypatch.setattr(services._session, "request", _request)
+    return calls
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """Stub the Bot-Service API and record the endpoints it is asked for."""
+    calls = []
+
+    def _handle_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        return {"endpoint": endpoint, "call": len(calls)}
+
+    monkeypatch.setattr(
+        BotServiceClient, "_handle_request", staticmethod(_handle_request)
+    )
+    cache.clear()
+    yield calls
+    cache.clear()
+
+
+@pytest.fixture
+def connect_attempts(monkeypatch):
+    """Count the connections urllib3 opens to the Bot-Service."""
+    attempts = []
+    create_connection = connection.create_connection
+
+    def _create_connection(address, *args, **kwargs):
+        attempts.append(address)
+        return create_connection(address, *args, **kwargs)
+
+    monkeypatch.setattr(connection, "create_connection", _create_connection)
+    return attempts
+
+
+@pytest.fixture
+def silent_server(settings):
+    """Point the client at a server that accepts requests but never replies.
+
+    Connections wait in the listen backlog, so they succeed while reading
+    the response times out.
+    """
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        host, port = server.getsockname()
+        settings.BOT_SERVICE_API_URL = f"http://{host}:{port}/"
+        yield
+
+
+@pytest.fixture
+def closed_port(settings):
+    """Point the client at a local port nothing listens on."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        host, port = probe.getsockname()
+    settings.BOT_SERVICE_API_URL = f"http://{host}:{port}/"
+
+
+class TestSession:
+    """Test case for the shared Bot-Service session."""
+
+    @pytest.mark.usefixtures("silent_server")
+    @pytest.mark.parametrize("method", ["POST", "GET"])
+    def test_read_timeout_is_not_retried(self, connect_attempts, method):
+        """Test that a request that reached the Bot-Service is sent once."""
+        with pytest.raises(BOT_SERVICE_ERRORS):
+            BotServiceClient._handle_request(
+                method, "menu/1", json={}, timeout=(1, 0.1)
+            )
+
+        assert len(connect_attempts) == 1
+
+    @pytest.mark.usefixtures("closed_port")
+    def test_connect_error_is_retried(self, connect_attempts):
+        """Test that failing to connect is retried twice."""
+        with pytest.raises(ConnectionError):
+            BotServiceClient._handle_request("POST", "menu/1", json={})
+
+        assert len(connect_attempts) == 3
+
+    def test_adapter_is_mounted_for_both_schemes(self):
+        """Test that http and https requests share the pooled adapter."""
+        assert services._session.get_adapter("http://x/") is services._adapter
+        assert services._session.get_adapter("https://x/") is services._adapter
+
+
+class TestHandleRequest:
+    """Test case for BotServiceClient._handle_request."""
+
+    def test_default_timeout(self, session_calls):
+        """Test that calls get the default timeout."""
+        result = BotServiceClient._handle_request("GET", "menu/1")
+
+        assert result == {"ok": True}
+        assert session_calls == [
+            (
+                "GET",
+                "http://bot-service/menu/1",
+                {"timeout": BOT_SERVICE_TIMEOUT},
+            )
+        ]
+
+    def test_explicit_timeout_is_kept(self, session_calls):
+        """Test that a timeout passed by the caller is not overridden."""
+        BotServiceClient._handle_request("GET", "menu/1", timeout=1)
+
+        assert session_calls[0][2]["timeout"] == 1
+
+
+class TestChainsCache:
+    """Test case for the cached bot chains."""
+
+    def test_cache_hit(self, api_calls):
+        """Test that repeated reads are served from the cache."""
+        first = BotServiceClient.get_bot_chains(7)
+
+        assert BotServiceClient.get_bot_chains(7) == first
+        assert api_calls == ["chains/7"]
+
+    def test_invalidate_after_write(self, api_calls):
+        """Test that ChainService drops the chains the menu client cached."""
+        BotServiceClient.get_bot_chains(7)
+        BotServiceClient.get_bot_chains(8)
+
+        ChainService.invalidate_bot_chains(7)
+
+        assert BotServiceClient.get_bot_chains(7)["call"] == 3
+        assert BotServiceClient.get_bot_chains(8)["call"] == 2
+        assert api_calls == ["chains/7", "chains/8", "chains/7"]
+
+
+@pytest.fixture
+def broken_cache(monkeypatch):
+    """Make every cache access fail as if Redis were down."""
+    monkeypatch.setattr(core_cache, "cache", BrokenCache())
+
+
+@pytest.fixture
+def failing_api(monkeypatch):
+    """Return a helper making every Bot-Service API call raise ``error``."""
+
+    def _fail(error):
+        def _handle_request(method, endpoint, **kwargs):
+            raise error
+
+        monkeypatch.setattr(
+            BotServiceClient, "_handle_request", staticmethod(_handle_request)
+        )
+        cache.clear()
+
+    yield _fail
+    cache.clear()
+
+
+class TestGetBotChainsSafe:
+    """Test case for BotServiceClient.get_bot_chains_safe."""
+
+    @pytest.mark.parametrize(
+        "error_class", BOT_SERVICE_ERRORS, ids=lambda cls: cls.__name__
+    )
+    def test_api_error(self, failing_api, error_class):
+        """Test that Bot-Service failures fall back to no chains."""
+        failing_api(error_class("API error"))
+
+        assert BotServiceClient.get_bot_chains_safe(7) == {"chains": {}}
+
+    def test_other_error_propagates(self, failing_api):
+        """Test that errors other than Bot-Service failures are raised."""
+        failing_api(ValueError("bad data"))
+
+        with pytest.raises(ValueError):
+            BotServiceClient.get_bot_chains_safe(7)
+
+
+@pytest.mark.usefixtures("owned_bot")
+class TestMainMenuCache:
+    """Test case for the cached main menu."""
+
+    def test_cache_hit(self, api_calls):
+        """Test that repeated reads are served from the cache."""
+        first = BotServiceClient.get_main_menu(self.bot.bot_id)
+
+        assert BotServiceClient.get_main_menu(self.bot.bot_id) == first
+        assert api_calls == [f"menu/{self.bot.bot_id}"]
+
+    def test_invalidate_after_write(self, api_calls, request_with_messages):
+        """Test that updating the menu drops the cached copy."""
+        BotServiceClient.get_main_menu(self.bot.bot_id)
+        request = request_with_messages(
+            "post", data={"welcome_message": "Hello"}
+        )
+        request.user = self.user
+
+        response = BotMainMenuView.as_view()(request, bot_id=self.bot.id)
+
+        assert response.status_code == 302
+        assert BotServiceClient.get_main_menu(self.bot.bot_id)["call"] == 3
+        assert len(api_calls) == 3
+
+
+@pytest.mark.usefixtures("owned_bot", "broken_cache")
+class TestCacheOutage:
+    """Test case for the menu pages while the cache backend is down."""
+
+    def test_main_menu_renders(self, api_calls, rf, template_context):
+        """Test that the menu is fetched from the Bot-Service instead."""
+        request = rf.get("/")
+        request.user = self.user
+
+        response = BotMainMenuView.as_view()(request, bot_id=self.bot.id)
+
+        assert response.status_code == 200
+        assert template_context["bot_main_menu"]["call"] == 1
+        assert BotServiceClient.get_bot_chains(7)["call"] == 2
+
+    def test_main_menu_update(self, api_calls, request_with_messages):
+        """Test that a failed invalidation does not fail the update."""
+        request = request_with_messages(
+            "post", data={"welcome_message": "Hello"}
+        )
+        request.user = self.user
+
+        response = BotMainMenuView.as_view()(request, bot_id=self.bot.id)
+
+        assert response.status_code == 302
+        assert [str(m) for m in messages.get_messages(request)] == [
+            "Успешно обновлено."
+        ]
+
+    def test_chains_invalidation(self):
+        """Test that a failed chains invalidation is not raised."""
+        ChainService.invalidate_bot_chains(7)
@@ -13,7 +13,7 @@ class TestBotMainMenuUrls(SimpleTestCase):
     def test_bot_main_menu_url_resolves(self):
         """Test that the bot main menu URL resolves to the correct view."""
         url = reverse("menu-main", args=[1])  # Generate URL with bot ID 1
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotMainMenuView
         )  # Check resolution to BotMainMenuView
         self.assertEqual(
@@ -25,7 +25,7 @@ class TestBotMainMenuUrls(SimpleTestCase):
         url = reverse(
             "menu-button-detail", args=[1, 2]
         )  # Generate URL with bot ID 1 and button ID 2
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, BotMainMenuButtonView
         )  # Check resolution to BotMainMenuButtonView
         self.assertEqual(
@@ -37,7 +37,7 @@ class TestBotMainMenuUrls(SimpleTestCase):
         url = reverse(
             "menu-button-update", args=[1, 2]
         )  # Generate URL for updating button
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, UpdateBotMainMenuButtonView
         )  # Check resolution to UpdateBotMainMenuButtonView
         self.assertEqual(
@@ -49,7 +49,7 @@ class TestBotMainMenuUrls(SimpleTestCase):
         url = reverse(
             "menu-button-create", args=[1]
         )  # Generate URL for creating button
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, CreateBotMainMenuButtonView
         )  # Check resolution to CreateBotMainMenuButtonView
         self.assertEqual(
@@ -61,7 +61,7 @@ class TestBotMainMenuUrls(SimpleTestCase):
         url = reverse(
             "menu-button-delete", args=[1, 2]
         )  # Generate URL for deleting button
-        self.assertEqual(
+        self.assertIs(
             resolve(url).func.view_class, DeleteBotMainMenuButtonView
         )  # Check resolution to DeleteBotMainMenuButtonView
         self.assertEqual(
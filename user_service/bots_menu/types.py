@@ -13,20 +13,6 @@ class MainMenuButtonData(TypedDict):
     chain_id: Optional[int]
 
 
-class ChainData(TypedDict):
-    id: int
-    name: str
-    steps: List["ChainStepData"]
-
-
-class ChainStepData(TypedDict):
-    id: int
-    name: str
-    message: str
-    text_input: bool
-    next_step_id: Optional[int]
-
-
 class BotResponse(TypedDict):
     success: bool
     data: Union[Dict[str, Any], List[Dict[str, Any]]]
@@ -1,4 +1,4 @@
-from django.urls import include, path
+from django.urls import path
 
 from .views import (
     BotMainMenuButtonView,
@@ -11,45 +11,26 @@ from .views import (
 
 urlpatterns = [
     path(
-        "bots/<int:bot_id>/menu/",
-        include(
-            [
-                path("", BotMainMenuView.as_view(), name="menu-main"),
-                path(
-                    "buttons/",
-                    include(
-                        [
-                            path(
-                                "",
-                                CreateBotMainMenuButtonView.as_view(),
-                                name="menu-button-create",
-                            ),
-                            path(
-                                "<int:button_id>/",
-                                include(
-                                    [
-                                        path(
-                                            "",
-                                            BotMainMenuButtonView.as_view(),
-                                            name="menu-button-detail",
-                                        ),
-                                        path(
-                                            "update/",
-                                            UpdateBotMainMenuButtonView.as_view(),
-                                            name="menu-button-update",
-                                        ),
-                                        path(
-                                            "delete/",
-                                            DeleteBotMainMenuButtonView.as_view(),
-                                            name="menu-button-delete",
-                                        ),
-                                    ]
-                                ),
-                            ),
-                        ]
-                    ),
-                ),
-            ]
-        ),
+        "bots/<int:bot_id>/menu/", BotMainMenuView.as_view(), name="menu-main"
+    ),
+    path(
+        "bots/<int:bot_id>/menu/buttons/",
+        CreateBotMainMenuButtonView.as_view(),
+        name="menu-button-create",
+    ),
+    path(
+        "bots/<int:bot_id>/menu/buttons/<int:button_id>/",
+        BotMainMenuButtonView.as_view(),
+        name="menu-button-detail",
+    ),
+    path(
+        "bots/<int:bot_id>/menu/buttons/<int:button_id>/update/",
+        UpdateBotMainMenuButtonView.as_view(),
+        name="menu-button-update",
+    ),
+    path(
+        "bots/<int:bot_id>/menu/buttons/<int:button_id>/delete/",
+        DeleteBotMainMenuButtonView.as_view(),
+        name="menu-button-delete",
     ),
 ]
@@ -1,24 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from bots.models import Bot
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404, HttpResponse
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
-from requests import RequestException
 
 from .forms import BotMainMenuButtonForm, BotMainMenuForm
-from .services import BotServiceClient
+from .services import BOT_SERVICE_ERRORS, BotServiceClient
 
 
-class BaseBotView(LoginRequiredMixin, View):
-    """Base view for bot-related operations with common functionality."""
+# Shared pool for independent Bot-Service calls made within one request,
+# so threads are not spawned and joined on every page load.
+_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="bots-menu")
+
+
+class BotOwnerRequiredMixin(LoginRequiredMixin):
+    """
+    Resolve the bot from the bot_id URL kwarg once per request.
+    Only bots owned by the user are found, any other bot_id is a 404.
+    Only the columns used by the views and templates are loaded.
+    """
+
+    bot: Bot
+
+    def dispatch(self, request, *args, **kwargs):
+        # Check login first: an anonymous user has no bots to look up.
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        self.bot = get_object_or_404(
+            Bot.objects.owned_by(request.user).only(
+                "id", "user_id", "bot_id", "bot_username"
+            ),
+            id=kwargs["bot_id"],
+        )
+        return super().dispatch(request, *args, **kwargs)
 
-    def validate_bot_ownership(self, request, bot_id: int) -> Bot:
-        """Validate that the user owns the bot and return the bot instance."""
-        bot = get_object_or_404(Bot, id=bot_id)
-        if bot.user != request.user:
-            raise Http404("Вы не являетесь владельцем данного бота.")
-        return bot
+
+class BaseBotView(BotOwnerRequiredMixin, View):
+    """Base view for bot-related operations with common functionality."""
 
 
 class BotMainMenuView(BaseBotView):
@@ -27,11 +49,11 @@ class BotMainMenuView(BaseBotView):
     template_name = "bots_menu/main_menu.html"
 
     def get(self, request, bot_id: int) -> HttpResponse:
-        bot = self.validate_bot_ownership(request, bot_id)
+        bot = self.bot
 
         try:
             main_menu = BotServiceClient.get_main_menu(bot.bot_id)
-        except RequestException:
+        except BOT_SERVICE_ERRORS:
             main_menu = {}
 
         return render(
@@ -41,7 +63,7 @@ class BotMainMenuView(BaseBotView):
         )
 
     def post(self, request, bot_id: int) -> HttpResponse:
-        bot = self.validate_bot_ownership(request, bot_id)
+        bot = self.bot
         form = BotMainMenuForm(request.POST)
 
         if not form.is_valid():
@@ -52,8 +74,9 @@ class BotMainMenuView(BaseBotView):
             BotServiceClient.update_main_menu(
                 bot.bot_id, form.cleaned_data["welcome_message"]
             )
+            BotServiceClient.invalidate_main_menu(bot.bot_id)
             messages.success(request, "Успешно обновлено.")
-        except RequestException:
+        except BOT_SERVICE_ERRORS:
             messages.error(
                 request,
                 "Ошибка при обновлении данных. Проверьте формат сообщения!",
@@ -68,12 +91,21 @@ class BotMainMenuButtonView(BaseBotView):
     template_name = "bots_menu/update_main_menu_button.html"
 
     def get(self, request, bot_id: int, button_id: int) -> HttpResponse:
-        bot = self.validate_bot_ownership(request, bot_id)
-        try:
-            button = BotServiceClient.get_main_menu_button(button_id)
-            chains_response = BotServiceClient.get_bot_chains(bot.bot_id)
+        bot = self.bot
+
+        # Both requests are independent, so fetch them concurrently. The
+        # chains are optional: if they fail the button is still editable.
+        button_future = _executor.submit(
+            BotServiceClient.get_main_menu_button, button_id
+        )
+        chains_future = _executor.submit(
+            BotServiceClient.get_bot_chains_safe, bot.bot_id
+        )
+        chains_response = chains_future.result()
 
-        except RequestException:
+        try:
+            button = button_future.result()
+        except BOT_SERVICE_ERRORS:
             messages.error(
                 request,
                 "Ошибка при загрузке данных. Попробуйте обновить страницу.",
@@ -97,7 +129,7 @@ class UpdateBotMainMenuButtonView(BaseBotView):
     """View for updating a bot's main menu button."""
 
     def post(self, request, bot_id: int, button_id: int) -> HttpResponse:
-        bot = self.validate_bot_ownership(request, bot_id)
+        bot = self.bot
         form = BotMainMenuButtonForm(request.POST)
 
         if not form.is_valid():
@@ -113,8 +145,9 @@ class UpdateBotMainMenuButtonView(BaseBotView):
                 reply_text=form.cleaned_data["reply_text"],
                 chain_id=form.cleaned_data["chain_id"] or None,
             )
+            BotServiceClient.invalidate_main_menu(bot.bot_id)
             messages.success(request, "Изменения сохранены.")
-        except RequestException:
+        except BOT_SERVICE_ERRORS:
             messages.error(
                 request,
                 "Ошибка при обновлении данных. Проверьте формат данных!",
@@ -129,12 +162,9 @@ class CreateBotMainMenuButtonView(BaseBotView):
     template_name = "bots_menu/create_main_menu_button.html"
 
     def get(self, request, bot_id: int) -> HttpResponse:
-        bot = self.validate_bot_ownership(request, bot_id)
+        bot = self.bot
 
-        try:
-            chains_response = BotServiceClient.get_bot_chains(bot.bot_id)
-        except RequestException:
-            chains_response = {"chains": {}}
+        chains_response = BotServiceClient.get_bot_chains_safe(bot.bot_id)
 
         return render(
             request,
@@ -143,7 +173,7 @@ class CreateBotMainMenuButtonView(BaseBotView):
         )
 
     def post(self, request, bot_id: int) -> HttpResponse:
-        bot = self.validate_bot_ownership(request, bot_id)
+        bot = self.bot
         form = BotMainMenuButtonForm(request.POST)
 
         if not form.is_valid():
@@ -157,8 +187,9 @@ class CreateBotMainMenuButtonView(BaseBotView):
                 reply_text=form.cleaned_data["reply_text"],
                 chain_id=form.cleaned_data["chain_id"] or None,
             )
+            BotServiceClient.invalidate_main_menu(bot.bot_id)
             messages.success(request, "Кнопка успешно создана.")
-        except RequestException:
+        except BOT_SERVICE_ERRORS:
             messages.error(
                 request,
                 "Ошибка при создании кнопки. Возможно такая кнопка уже существует. Запрещено использовать названия служебных команд '/start', '/update'.",
@@ -171,12 +202,13 @@ class DeleteBotMainMenuButtonView(BaseBotView):
     """View for deleting a main menu button for a bot."""
 
     def post(self, request, bot_id: int, button_id: int) -> HttpResponse:
-        self.validate_bot_ownership(request, bot_id)
+        bot = self.bot
 
         try:
             BotServiceClient.delete_main_menu_button(button_id)
+            BotServiceClient.invalidate_main_menu(bot.bot_id)
             messages.success(request, "Кнопка успешно удалена.")
-        except RequestException:
+        except BOT_SERVICE_ERRORS:
             messages.error(
                 request, "Ошибка при удалении кнопки. Попробуйте позже."
             )
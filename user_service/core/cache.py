@@ -0,0 +1,43 @@
+import logging
+from typing import Any, Callable
+
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger("bots")
+
+# Failures of the shared cache backend. The cache only saves calls to the
+# Bot-Service, so pages must keep working while it is unavailable.
+CACHE_ERRORS = (RedisError,)
+
+
+def get_or_fetch(key: str, fetch: Callable[[], Any], timeout: int) -> Any:
+    """
+    Return the cached value for key, calling fetch and caching its result
+    on a miss. If the cache backend fails, fall back to calling fetch.
+    """
+    try:
+        value = cache.get(key)
+    except CACHE_ERRORS:
+        logger.warning("Cache read failed. Key: %s", key, exc_info=True)
+        return fetch()
+
+    if value is None:
+        value = fetch()
+        try:
+            cache.set(key, value, timeout)
+        except CACHE_ERRORS:
+            logger.warning("Cache write failed. Key: %s", key, exc_info=True)
+    return value
+
+
+def delete(key: str) -> None:
+    """
+    Drop the cached value for key. If the cache backend fails, the value
+    expires on its own after its timeout.
+    """
+    try:
+        cache.delete(key)
+    except CACHE_ERRORS:
+        logger.warning("Cache delete failed. Key: %s", key, exc_info=True)
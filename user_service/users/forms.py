@@ -3,12 +3,45 @@ from django.contrib.auth.forms import AuthenticationForm, UserCreationForm
 from django.contrib.auth.models import User
 
 
+INPUT_CLASS = "form-control form-control-user"
+
+# Extra widget attrs for the fields RegisterForm inherits from
+# UserCreationForm. They are merged into each form's own widget copies.
+REGISTER_FIELD_ATTRS = {
+    "username": {"class": INPUT_CLASS, "placeholder": "Ваш логин"},
+    "password1": {"class": INPUT_CLASS, "placeholder": "Ваш пароль"},
+    "password2": {
+        "class": INPUT_CLASS,
+        "placeholder": "Повторите ваш пароль",
+    },
+}
+
+
+def add_css_class(attrs: dict, css_class: str) -> None:
+    """Add a CSS class to widget attrs unless it is already there."""
+    classes = attrs.get("class", "").split()
+    if css_class not in classes:
+        classes.append(css_class)
+        attrs["class"] = " ".join(classes)
+
+
+def mark_invalid_fields(form: forms.Form) -> None:
+    """Add the is-invalid class to widgets of fields that have errors."""
+    if not form.is_bound:
+        return
+
+    for field_name in form.errors:
+        field = form.fields.get(field_name)
+        if field is not None:
+            add_css_class(field.widget.attrs, "is-invalid")
+
+
 class RegisterForm(UserCreationForm):
     email = forms.EmailField(
         required=True,
         widget=forms.EmailInput(
             attrs={
-                "class": "form-control form-control-user",
+                "class": INPUT_CLASS,
                 "placeholder": "Ваш Email адрес",
             }
         ),
@@ -21,40 +54,17 @@ class RegisterForm(UserCreationForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.fields["username"].widget.attrs.update(
-            {
-                "class": "form-control form-control-user",
-                "placeholder": "Ваш логин",
-            }
-        )
-        self.fields["password1"].widget.attrs.update(
-            {
-                "class": "form-control form-control-user",
-                "placeholder": "Ваш пароль",
-            }
-        )
-        self.fields["password2"].widget.attrs.update(
-            {
-                "class": "form-control form-control-user",
-                "placeholder": "Повторите ваш пароль",
-            }
-        )
+        for field_name, attrs in REGISTER_FIELD_ATTRS.items():
+            self.fields[field_name].widget.attrs.update(attrs)
 
-        for field_name, field in self.fields.items():
-            if self.errors.get(field_name):
-                field.widget.attrs.update(
-                    {
-                        "class": field.widget.attrs.get("class", "")
-                        + " is-invalid"
-                    }
-                )
+        mark_invalid_fields(self)
 
 
 class LoginForm(AuthenticationForm):
     username = forms.CharField(
         widget=forms.TextInput(
             attrs={
-                "class": "form-control form-control-user",
+                "class": INPUT_CLASS,
                 "placeholder": "Ваш логин",
             }
         )
@@ -62,7 +72,7 @@ class LoginForm(AuthenticationForm):
     password = forms.CharField(
         widget=forms.PasswordInput(
             attrs={
-                "class": "form-control form-control-user",
+                "class": INPUT_CLASS,
                 "placeholder": "Ваш пароль",
             }
         )
@@ -70,11 +80,4 @@ class LoginForm(AuthenticationForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for field_name, field in self.fields.items():
-            if self.errors.get(field_name):
-                field.widget.attrs.update(
-                    {
-                        "class": field.widget.attrs.get("class", "")
-                        + " is-invalid"
-                    }
-                )
+        mark_invalid_fields(self)
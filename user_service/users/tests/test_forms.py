@@ -1,12 +1,17 @@
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.models import User
-from django.test import TestCase
-from users.forms import LoginForm, RegisterForm
+from django.test import SimpleTestCase, TestCase
+from users.forms import (
+    INPUT_CLASS,
+    LoginForm,
+    RegisterForm,
+    mark_invalid_fields,
+)
 
 
-class RegisterFormTest(TestCase):
-    """Test suite for the RegisterForm class."""
+class RegisterFormStructureTest(SimpleTestCase):
+    """Test suite for the RegisterForm fields and widgets."""
 
     def test_form_meta(self):
         """Check the form's model and fields."""
@@ -59,6 +64,43 @@ class RegisterFormTest(TestCase):
                 for attr, value in expected_attrs.items():
                     self.assertEqual(widget.attrs[attr], value)
 
+    def test_error_class_adding(self):
+        """Test addition of the 'is-invalid' class on errors."""
+        invalid_data = {
+            "username": "",
+            "email": "test@example.com",
+            "password1": "ComplexPass123!",
+            "password2": "ComplexPass123!",
+        }
+        form = RegisterForm(data=invalid_data)
+        form.is_valid()  # Process validation
+
+        self.assertIn(
+            "is-invalid",
+            form.fields["username"].widget.attrs["class"],
+            msg="Username field should have 'is-invalid' class.",
+        )
+        self.assertNotIn(
+            "is-invalid",
+            form.fields["email"].widget.attrs["class"],
+            msg="Email field should not have 'is-invalid' class.",
+        )
+
+    def test_error_class_added_once(self):
+        """Test that marking invalid fields again does not repeat the class."""
+        form = RegisterForm(data={"username": ""})
+
+        mark_invalid_fields(form)
+        mark_invalid_fields(form)
+
+        classes = form.fields["username"].widget.attrs["class"].split()
+        self.assertEqual(classes.count("is-invalid"), 1)
+        self.assertEqual(" ".join(classes[:-1]), INPUT_CLASS)
+
+
+class RegisterFormValidationTest(TestCase):
+    """Test suite for RegisterForm validation, which checks the database."""
+
     def test_form_validation(self):
         """Check that the form validates correctly with valid and invalid data."""
         valid_data = {
@@ -101,30 +143,8 @@ class RegisterFormTest(TestCase):
                     msg=f"Form should be invalid for case: {case}",
                 )
 
-    def test_error_class_adding(self):
-        """Test addition of the 'is-invalid' class on errors."""
-        invalid_data = {
-            "username": "",
-            "email": "test@example.com",
-            "password1": "ComplexPass123!",
-            "password2": "ComplexPass123!",
-        }
-        form = RegisterForm(data=invalid_data)
-        form.is_valid()  # Process validation
-
-        self.assertIn(
-            "is-invalid",
-            form.fields["username"].widget.attrs["class"],
-            msg="Username field should have 'is-invalid' class.",
-        )
-        self.assertNotIn(
-            "is-invalid",
-            form.fields["email"].widget.attrs["class"],
-            msg="Email field should not have 'is-invalid' class.",
-        )
-
 
-class LoginFormTest(TestCase):
+class LoginFormTest(SimpleTestCase):
     """Test suite for the LoginForm class."""
 
     def test_form_inheritance(self):
@@ -1,65 +1,30 @@
-from django.test import SimpleTestCase
+import unittest
+
 from django.urls import resolve, reverse
 from users.views import LoginView, LogoutView, RegisterView
 
 
-class TestAuthUrls(SimpleTestCase):
+class TestAuthUrls(unittest.TestCase):
     """Test suite for authentication URLs."""
 
-    def test_register_url_resolves(self):
-        """Test that the register URL resolves to the RegisterView."""
-        url = reverse("register")
-        self.assertEqual(
-            resolve(url).func.view_class,
-            RegisterView,
-            msg="Register URL should resolve to RegisterView.",
-        )
-        self.assertEqual(
-            url,
-            "/auth/register/",
-            msg="Register URL does not match the expected pattern.",
-        )
-
-    def test_login_url_resolves(self):
-        """Test that the login URL resolves to the LoginView."""
-        url = reverse("login")
-        self.assertEqual(
-            resolve(url).func.view_class,
-            LoginView,
-            msg="Login URL should resolve to LoginView.",
-        )
-        self.assertEqual(
-            url,
-            "/auth/login/",
-            msg="Login URL does not match the expected pattern.",
-        )
-
-    def test_logout_url_resolves(self):
-        """Test that the logout URL resolves to the LogoutView."""
-        url = reverse("logout")
-        self.assertEqual(
-            resolve(url).func.view_class,
-            LogoutView,
-            msg="Logout URL should resolve to LogoutView.",
-        )
-        self.assertEqual(
-            url,
-            "/auth/logout/",
-            msg="Logout URL does not match the expected pattern.",
-        )
+    URL_CASES = (
+        ("register", (), "/auth/register/", RegisterView),
+        ("login", (), "/auth/login/", LoginView),
+        ("logout", (), "/auth/logout/", LogoutView),
+    )
 
     def test_url_patterns(self):
-        """Test URL patterns for authentication."""
-        test_cases = [
-            ("register", [], "/auth/register/"),
-            ("login", [], "/auth/login/"),
-            ("logout", [], "/auth/logout/"),
-        ]
-
-        for name, args, expected_url in test_cases:
+        """Test that auth URLs reverse and resolve to their views."""
+        for name, args, expected_url, view_class in self.URL_CASES:
             with self.subTest(name=name):
+                url = reverse(name, args=args)
                 self.assertEqual(
-                    reverse(name, args=args),
+                    url,
                     expected_url,
                     msg=f"URL reverse for {name} does not match expected.",
                 )
+                self.assertIs(
+                    resolve(url).func.view_class,
+                    view_class,
+                    msg=f"URL {name} should resolve to {view_class.__name__}.",
+                )
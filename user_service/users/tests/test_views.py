@@ -0,0 +1,124 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+
+class RegisterViewTestCase(TestCase):
+    def test_get(self):
+        """Test GET request renders the registration form."""
+        response = self.client.get(reverse("register"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "users/register.html")
+
+    def test_post_valid_data(self):
+        """Test POST request with valid data creates and logs in a user."""
+        response = self.client.post(
+            reverse("register"),
+            {
+                "username": "newuser",
+                "email": "new@example.com",
+                "password1": "ComplexPass123!",
+                "password2": "ComplexPass123!",
+            },
+        )
+
+        self.assertRedirects(
+            response, reverse("index"), fetch_redirect_response=False
+        )
+        user = User.objects.get(username="newuser")
+        self.assertEqual(int(self.client.session["_auth_user_id"]), user.pk)
+
+    def test_post_invalid_data(self):
+        """Test POST request with mismatched passwords re-renders the form."""
+        response = self.client.post(
+            reverse("register"),
+            {
+                "username": "newuser",
+                "email": "new@example.com",
+                "password1": "ComplexPass123!",
+                "password2": "DifferentPass123!",
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "users/register.html")
+        self.assertFalse(User.objects.filter(username="newuser").exists())
+
+
+class LoginViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user that logs in."""
+        cls.user = User.objects.create_user(
+            username="testuser", password="ComplexPass123!"
+        )
+
+    def test_get(self):
+        """Test GET request renders the login form."""
+        response = self.client.get(reverse("login"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "users/login.html")
+
+    def test_post_valid_credentials(self):
+        """Test POST request with valid credentials logs the user in."""
+        response = self.client.post(
+            reverse("login"),
+            {"username": "testuser", "password": "ComplexPass123!"},
+        )
+
+        self.assertRedirects(
+            response, reverse("index"), fetch_redirect_response=False
+        )
+        self.assertEqual(
+            int(self.client.session["_auth_user_id"]), self.user.pk
+        )
+
+    def test_post_invalid_credentials(self):
+        """Test POST request with a wrong password re-renders the form."""
+        response = self.client.post(
+            reverse("login"),
+            {"username": "testuser", "password": "wrong"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "users/login.html")
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+
+class LogoutViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user that logs out."""
+        cls.user = User.objects.create_user(
+            username="testuser", password="ComplexPass123!"
+        )
+
+    def test_logout_authenticated(self):
+        """Test that an authenticated user is logged out and redirected."""
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse("logout"))
+
+        self.assertRedirects(
+            response, reverse("index"), fetch_redirect_response=False
+        )
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+    def test_logout_anonymous(self):
+        """Test that an anonymous user is just redirected."""
+        response = self.client.post(reverse("logout"))
+
+        self.assertRedirects(
+            response, reverse("index"), fetch_redirect_response=False
+        )
+
+    def test_logout_get_not_allowed(self):
+        """Test that GET requests no longer log the user out."""
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("logout"))
+
+        self.assertEqual(response.status_code, 405)
+        self.assertIn("_auth_user_id", self.client.session)
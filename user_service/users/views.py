@@ -1,89 +1,75 @@
 from django.contrib import messages
-from django.contrib.auth import authenticate, login, logout
-from django.shortcuts import redirect, render
+from django.contrib.auth import login, logout
+from django.http import HttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse_lazy
 from django.views import View
+from django.views.generic.edit import FormView
 
 from .forms import LoginForm, RegisterForm
 
 
-class RegisterView(View):
+class RegisterView(FormView):
     """
     View for user registration.
-    Handles both GET and POST requests for the registration form.
+    Renders the registration form and, if it is valid, creates a new user,
+    logs them in and redirects to the home page.
     """
 
-    def get(self, request):
-        """
-        Handles GET requests.
-        Renders the registration form.
-        """
-        form = RegisterForm()
-        return render(request, "users/register.html", {"form": form})
+    template_name = "users/register.html"
+    form_class = RegisterForm
+    success_url = reverse_lazy("index")
 
-    def post(self, request):
-        """
-        Handles POST requests.
-        Processes the registration form data.
-        If the form is valid, creates a new user, logs them in, and redirects to the home page.
-        If the form is invalid, re-renders the form with error messages.
-        """
-        form = RegisterForm(request.POST)
-        if form.is_valid():
-            user = form.save()  # Save the new user
-            login(request, user)  # Log the user in
-            return redirect("index")
-        return render(request, "users/register.html", {"form": form})
+    def form_valid(self, form) -> HttpResponse:
+        """Save the new user and log them in."""
+        user = form.save()  # Save the new user
+        login(self.request, user)  # Log the user in
+        return super().form_valid(form)
 
 
-class LoginView(View):
+class LoginView(FormView):
     """
     View for user login.
-    Handles both GET and POST requests for the login form.
+    Renders the login form and, if the credentials are valid, logs the user
+    in and redirects to the home page.
     """
 
-    def get(self, request):
-        """
-        Handles GET requests.
-        Renders the login form.
-        """
-        form = LoginForm()
-        return render(request, "users/login.html", {"form": form})
+    template_name = "users/login.html"
+    form_class = LoginForm
+    success_url = reverse_lazy("index")
 
-    def post(self, request):
-        """
-        Handles POST requests.
-        Processes the login form data.
-        If the form is valid and the user is authenticated, logs them in and redirects to the home page.
-        If the form is invalid or authentication fails, re-renders the form with error messages.
-        """
-        form = LoginForm(request, data=request.POST)
-        if form.is_valid():
-            username = form.cleaned_data.get(
-                "username"
-            )  # Get username from the form
-            password = form.cleaned_data.get(
-                "password"
-            )  # Get password from the form
-            user = authenticate(
-                username=username, password=password
-            )  # Authenticate the user
-            if user is not None:
-                login(request, user)  # Log the user in
-                return redirect("index")
-        messages.error(request, "Неверный логин/пароль.")
-        return render(request, "users/login.html", {"form": form})
+    def get_form_kwargs(self):
+        """Pass the request to the form, as AuthenticationForm expects."""
+        kwargs = super().get_form_kwargs()
+        kwargs["request"] = self.request
+        return kwargs
+
+    def form_valid(self, form) -> HttpResponse:
+        """Log in the user the form authenticated."""
+        # AuthenticationForm already authenticated the user while
+        # validating, so reuse it instead of checking the password again.
+        login(self.request, form.get_user())  # Log the user in
+        return super().form_valid(form)
+
+    def form_invalid(self, form) -> HttpResponse:
+        """Re-render the form with an error message."""
+        messages.error(self.request, "Неверный логин/пароль.")
+        return super().form_invalid(form)
 
 
 class LogoutView(View):
     """
     View for user logout.
-    Handles GET requests to log the user out.
+    Handles POST requests to log the user out, so links, prefetchers and
+    crawlers cannot end a session.
     """
 
-    def get(self, request):
+    def post(self, request):
         """
-        Handles GET requests.
-        Logs the user out and redirects to the registration page.
+        Handles POST requests.
+        Logs the user out and redirects to the home page.
         """
-        logout(request)  # Log the user out
+        # Anonymous hits have nothing to log out, so skip the session flush.
+        if request.user.is_authenticated:
+            logout(request)  # Log the user out
         return redirect("index")